@@ -2,7 +2,6 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from discord.ui import View, Select, Modal, TextInput, Button
-import aiohttp
 from urllib.parse import urlparse
 import webcolors
 import random
@@ -14,21 +13,8 @@ class EmbedCreator(commands.Cog):
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession()
 
 
-    async def close(self) -> None:
-        """Close the aiohttp session."""
-        await self.session.close()
-
-    @commands.Cog.listener()
-    async def on_shutdown(self):
-        await self.close()
-
-    @commands.Cog.listener()
-    async def on_disconnect(self):
-        await self.close()
-
     @app_commands.command(name="embed",
                           description="Create a custom embed message")
     async def embed(self, interaction: discord.Interaction) -> None:
@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands
 import traceback
-import aiohttp
 from typing import Optional, Union, List
 from difflib import get_close_matches
 
@@ -22,7 +21,6 @@ class Errors(commands.Cog):
             bot (commands.Bot): The instance of the bot.
         """
         self.bot = bot
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession()
 
     async def send_error_embed(self, ctx: commands.Context, title: str,
                                description: str,
@@ -43,20 +41,6 @@ class Errors(commands.Cog):
         view.add_item(HelpButton(ctx, title, description, button_color))
         await ctx.send(embed=embed, view=view, ephemeral=True)
 
-    async def close(self) -> None:
-        """
-        Close the aiohttp client session.
-        """
-        await self.session.close()
-
-    @commands.Cog.listener()
-    async def on_shutdown(self):
-        await self.close()
-
-    @commands.Cog.listener()
-    async def on_disconnect(self):
-        await self.close()
-
     async def handle_error(self, ctx: commands.Context, command_name: str,
                            description: str, title: str) -> None:
         """
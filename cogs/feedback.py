@@ -4,7 +4,6 @@ from discord import app_commands
 from discord.ui import View, Select, Modal, TextInput, Button
 import json
 import os
-import aiohttp
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
@@ -269,23 +268,10 @@ class Feedback(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         """Initialize the Feedback cog with the bot and set up the views."""
         self.bot = bot
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession()
         self.bot.add_view(FeedbackView())  # Register the persistent view
         self.bot.add_view(
             FeedbackVoteView())  # Register the persistent vote view
 
-    async def close(self) -> None:
-        """Close the aiohttp session when the cog is unloaded."""
-        await self.session.close()
-
-    @commands.Cog.listener()
-    async def on_shutdown(self):
-        await self.close()
-
-    @commands.Cog.listener()
-    async def on_disconnect(self):
-        await self.close()
-
     @app_commands.command(name="feedback",
                           description="Send feedback using a dropdown")
     async def feedback(self, interaction: discord.Interaction) -> None:
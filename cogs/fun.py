@@ -8,7 +8,6 @@ from main import Bot
 from typing import Union
 from scripts.emojify import emojify_image
 from jokeapi import Jokes
-import aiohttp
 import requests
 from scripts.asciify import asciify
 import os
@@ -21,18 +20,6 @@ class Fun(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession()
-
-    async def close(self):
-        await self.session.close()
-
-    @commands.Cog.listener()
-    async def on_shutdown(self):
-        await self.close()
-
-    @commands.Cog.listener()
-    async def on_disconnect(self):
-        await self.close()
 
     class Fun(commands.Cog):
 
@@ -2,7 +2,6 @@ import discord
 from discord.ext import commands
 from typing import Optional
 from discord.ui import Button, View
-import aiohttp
 import time
 import random  # Import random module
 
@@ -33,18 +32,6 @@ class Moderation(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
-
-    async def close(self):
-        await self.session.close()
-
-    @commands.Cog.listener()
-    async def on_shutdown(self):
-        await self.close()
-
-    @commands.Cog.listener()
-    async def on_disconnect(self):
-        await self.close()
 
     @commands.command(aliases=['av', 'pfp'])
     async def avatar(self, ctx, user: Optional[discord.User] = None):
@@ -1,121 +1,270 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
 import json
+import logging
 import os
 import random
+import re
+import sqlite3
 import string
+from contextlib import closing
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = "data/reaction_roles.db"
+# Old JSON store, imported once when the database is first created
 DATA_PATH = "data/reaction_roles.json"
 
+# One button per message, so the message ID is the primary key
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS rr_buttons (
+    message_id INTEGER PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    role_id INTEGER NOT NULL,
+    emoji TEXT NOT NULL,
+    color INTEGER NOT NULL,
+    custom_id TEXT NOT NULL UNIQUE
+)
+"""
+COLUMNS = ("guild_id", "channel_id", "role_id", "emoji", "color", "custom_id")
+INSERT_BUTTON = "INSERT OR REPLACE INTO rr_buttons VALUES (?, ?, ?, ?, ?, ?, ?)"
+DELETE_BUTTON = "DELETE FROM rr_buttons WHERE message_id = ?"
+SELECT_BUTTONS = f"SELECT message_id, {', '.join(COLUMNS)} FROM rr_buttons"
+# Stored in PRAGMA user_version once the legacy JSON import has run
+SCHEMA_VERSION = 1
+
+# Rows indexed between yields to the event loop when loading
+LOAD_CHUNK_SIZE = 500
+
+# Button styles keyed by their stored integer value
+BUTTON_STYLES = {style.value: style for style in discord.ButtonStyle}
+
+# Colour of the reaction role summary embed
+SUMMARY_COLOR = discord.Color.blue()
+
+# Captures the channel and message IDs from a Discord message link
+MESSAGE_LINK = re.compile(r"/channels/\d+/(\d+)/(\d+)/?$")
+
+
+def read_json_rows():
+    """Yields database rows from the old guild -> message JSON file"""
+    with open(DATA_PATH, "rb") as file:
+        if ijson is not None:
+            # Stream one guild at a time instead of parsing the whole file
+            guilds = ijson.kvitems(file, "")
+        else:
+            guilds = json_loads(file.read()).items()
+
+        for guild_id, messages in guilds:
+            for message_id, details in messages.items():
+                try:
+                    row = (int(message_id), int(guild_id),
+                           int(details['channel_id']),
+                           int(details['role_id']), details['emoji'],
+                           int(details['color']), details['custom_id'])
+                except (KeyError, TypeError, ValueError):
+                    logger.warning("Skipping malformed reaction role %s",
+                                   message_id)
+                    continue
+                yield row
+
+
+def open_database():
+    """Creates the reaction role table if needed and returns every row"""
+    with closing(sqlite3.connect(DB_PATH)) as db:
+        with db:
+            # Create and import in one transaction so a failed import is
+            # rolled back and retried on the next start
+            db.execute("BEGIN")
+            db.execute(CREATE_TABLE)
+            version = db.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                empty = db.execute(
+                    "SELECT 1 FROM rr_buttons LIMIT 1").fetchone() is None
+                if empty and os.path.exists(DATA_PATH):
+                    db.executemany(INSERT_BUTTON, read_json_rows())
+                db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        return db.execute(SELECT_BUTTONS).fetchall()
+
+
+def execute(query, params):
+    """Runs a single write against the reaction role database"""
+    with closing(sqlite3.connect(DB_PATH)) as db, db:
+        db.execute(query, params)
+
+
+class ReactionRoleEntry:
+    """A saved reaction role button"""
+
+    # Slots keep per-entry memory low for bots with many reaction roles
+    __slots__ = COLUMNS
+
+    def __init__(self, guild_id, channel_id, role_id, emoji, color,
+                 custom_id):
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.role_id = role_id
+        self.emoji = emoji
+        self.color = color
+        self.custom_id = custom_id
+
+    def to_row(self, message_id):
+        """Returns the database row for this button"""
+        return (message_id, self.guild_id, self.channel_id, self.role_id,
+                self.emoji, self.color, self.custom_id)
+
 
 class ReactionRole(commands.Cog):
 
     def __init__(self, bot):
         """Initializes the ReactionRole Cog"""
         self.bot = bot
-        self.reaction_roles = self.load_reaction_roles()
-        self.bot.loop.create_task(self.setup_reaction_roles())
-
-    def load_reaction_roles(self):
-        """Loads the reaction roles from the JSON file"""
-        if not os.path.exists(DATA_PATH):
-            return {}
-        with open(DATA_PATH, "r") as file:
-            return json.load(file)
-
-    def save_reaction_roles(self):
-        """Saves the reaction roles to the JSON file"""
-        with open(DATA_PATH, "w") as file:
-            json.dump(self.reaction_roles, file, indent=4)
-
-    async def setup_reaction_roles(self):
-        """Sets up reaction roles for messages when the bot starts"""
-        await self.bot.wait_until_ready()
-        to_delete = []
-
-        for guild_id, messages in self.reaction_roles.items():
-            for message_id, details in list(messages.items()):
-                channel = self.bot.get_channel(int(details['channel_id']))
-                if channel is not None:
-                    try:
-                        message = await channel.fetch_message(int(message_id))
-                        color = discord.ButtonStyle(int(details['color']))
-                        await self.add_buttons_to_message(
-                            message, details['role_id'], details['emoji'],
-                            color, details['custom_id'])
-                    except discord.NotFound:
-                        to_delete.append((guild_id, message_id))
-
-        # Remove messages that no longer exist
-        for guild_id, message_id in to_delete:
-            if message_id in self.reaction_roles[guild_id]:
-                del self.reaction_roles[guild_id][message_id]
-            if not self.reaction_roles[guild_id]:
-                del self.reaction_roles[guild_id]
-
-        self.save_reaction_roles()
-
-    async def add_buttons_to_message(self, message, role_id, emoji, color,
-                                     custom_id):
-        """Adds buttons to the message"""
-        guild = message.guild
-        role = guild.get_role(int(role_id))
-        button = discord.ui.Button(style=color,
-                                   emoji=emoji,
-                                   custom_id=custom_id)
-
-        async def button_callback(interaction: discord.Interaction):
-            if role in interaction.user.roles:
-                await interaction.user.remove_roles(role)
-                await interaction.response.send_message(
-                    f"Role {role.name} removed!", ephemeral=True)
-            else:
-                await interaction.user.add_roles(role)
-                await interaction.response.send_message(
-                    f"Role {role.name} assigned!", ephemeral=True)
-
-        button.callback = button_callback
-
+        # Keyed by message ID
+        self.reaction_roles = {}
+        # Button custom IDs -> message ID, used to route clicks
+        self.custom_ids = {}
+        # Serialises database writes so they apply in the order they're made
+        self.db_lock = asyncio.Lock()
+
+    async def cog_load(self):
+        """Loads the saved reaction roles"""
+        await self.load_reaction_roles()
+
+    async def load_reaction_roles(self):
+        """Loads the reaction roles from the database"""
+        rows = await asyncio.to_thread(open_database)
+        for index, (message_id, *values) in enumerate(rows, 1):
+            entry = ReactionRoleEntry(*values)
+            self.reaction_roles[message_id] = entry
+            self.custom_ids[entry.custom_id] = message_id
+            if index % LOAD_CHUNK_SIZE == 0:
+                # Let the other cogs load while a large table is indexed
+                await asyncio.sleep(0)
+
+    def forget_reaction_role(self, message_id):
+        """Drops the in-memory reaction role of a message, if any"""
+        entry = self.reaction_roles.pop(message_id, None)
+        if entry is None:
+            return False
+        del self.custom_ids[entry.custom_id]
+        return True
+
+    async def save_reaction_role(self, message_id, entry):
+        """Saves a reaction role, replacing any previous one on the message"""
+        async with self.db_lock:
+            await asyncio.to_thread(execute, INSERT_BUTTON,
+                                    entry.to_row(message_id))
+            # Only update memory once the row is stored
+            self.forget_reaction_role(message_id)
+            self.reaction_roles[message_id] = entry
+            self.custom_ids[entry.custom_id] = message_id
+
+    async def remove_reaction_role(self, message_id):
+        """Deletes the reaction role attached to a message, if any"""
+        async with self.db_lock:
+            if message_id not in self.reaction_roles:
+                return
+            try:
+                await asyncio.to_thread(execute, DELETE_BUTTON,
+                                        (message_id, ))
+            except sqlite3.Error:
+                logger.exception("Failed to delete reaction role %s",
+                                 message_id)
+                return
+            self.forget_reaction_role(message_id)
+
+    def build_view(self, entry):
+        """Builds the view used to render a reaction role button"""
+        button = discord.ui.Button(style=BUTTON_STYLES[entry.color],
+                                   emoji=entry.emoji,
+                                   custom_id=entry.custom_id)
         view = discord.ui.View(timeout=None)
         view.add_item(button)
-        await message.edit(view=view)
+        return view
+
+    async def send_reply(self, interaction: discord.Interaction, content):
+        """Sends an ephemeral reply, using a followup if already responded"""
+        if interaction.response.is_done():
+            await interaction.followup.send(content, ephemeral=True)
+        else:
+            await interaction.response.send_message(content, ephemeral=True)
+
+    async def toggle_role(self, interaction: discord.Interaction, role_id):
+        """Adds or removes a reaction role for the member who clicked"""
+        member = interaction.user
+        # Member.get_role checks the member's own role IDs directly
+        role = member.get_role(role_id)
+        removing = role is not None
+        if not removing:
+            role = interaction.guild.get_role(role_id)
+            if role is None:
+                await self.send_reply(interaction,
+                                      "This role no longer exists.")
+                return
+
+        try:
+            if removing:
+                await member.remove_roles(role)
+            else:
+                await member.add_roles(role)
+        except discord.HTTPException:
+            logger.exception("Failed to toggle reaction role %s", role_id)
+            await self.send_reply(
+                interaction,
+                "I couldn't update your roles. Please try again later.")
+            return
+
+        action = "removed" if removing else "assigned"
+        await self.send_reply(interaction, f"Role {role.name} {action}!")
 
     @commands.Cog.listener()
-    async def on_ready(self):
-        """Listener that runs when the bot is ready"""
-        to_delete = []
-        for guild_id, messages in list(self.reaction_roles.items()):
-            for message_id in list(messages.keys()):
-                channel = self.bot.get_channel(
-                    int(messages[message_id]['channel_id']))
-                try:
-                    await channel.fetch_message(message_id)
-                except discord.NotFound:
-                    to_delete.append((guild_id, message_id))
+    async def on_interaction(self, interaction: discord.Interaction):
+        """Handles clicks on every reaction role button"""
+        if interaction.type is not discord.InteractionType.component:
+            return
 
-        # Remove messages that no longer exist
-        for guild_id, message_id in to_delete:
-            if guild_id in self.reaction_roles and message_id in self.reaction_roles[
-                    guild_id]:
-                del self.reaction_roles[guild_id][message_id]
-                if not self.reaction_roles[guild_id]:
-                    del self.reaction_roles[guild_id]
+        message_id = self.custom_ids.get(interaction.data.get("custom_id"))
+        if message_id is None:
+            return
 
-        self.save_reaction_roles()
+        entry = self.reaction_roles[message_id]
+        await self.toggle_role(interaction, entry.role_id)
 
     @commands.Cog.listener()
-    async def on_message_delete(self, message):
+    async def on_raw_message_delete(self, payload):
         """Listener that runs when a message is deleted"""
-        guild_id = str(message.guild.id)
-        message_id = str(message.id)
+        await self.remove_reaction_role(payload.message_id)
 
-        if guild_id in self.reaction_roles and message_id in self.reaction_roles[
-                guild_id]:
-            del self.reaction_roles[guild_id][message_id]
-            if not self.reaction_roles[guild_id]:
-                del self.reaction_roles[guild_id]
-            self.save_reaction_roles()
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Listener that runs when a channel is deleted"""
+        for message_id, entry in list(self.reaction_roles.items()):
+            if entry.channel_id == channel.id:
+                await self.remove_reaction_role(message_id)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Drops reaction roles whose channel was deleted while offline"""
+        # Only checks the channel cache; messages are never fetched here
+        for message_id, entry in list(self.reaction_roles.items()):
+            guild = self.bot.get_guild(entry.guild_id)
+            if guild is None or guild.unavailable:
+                continue
+            if guild.get_channel(entry.channel_id) is None:
+                await self.remove_reaction_role(message_id)
 
     @app_commands.command(name="reaction-role",
                           description="Add a reaction role to a message")
@@ -134,12 +283,17 @@ class ReactionRole(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         # Parse the message link to get message and channel IDs
-        if "/" in message_link:
-            message_id = int(message_link.split("/")[-1])
-            channel_id = int(message_link.split("/")[-2])
-        else:
+        message_link = message_link.strip()
+        match = MESSAGE_LINK.search(message_link)
+        if match:
+            channel_id, message_id = map(int, match.groups())
+        elif message_link.isdecimal():
             message_id = int(message_link)
             channel_id = interaction.channel.id
+        else:
+            await interaction.followup.send(
+                "Invalid message link or ID.", ephemeral=True)
+            return
 
         channel = interaction.guild.get_channel(channel_id)
         if not channel:
@@ -153,6 +307,24 @@ class ReactionRole(commands.Cog):
             await interaction.followup.send("Message not found.",
                                             ephemeral=True)
             return
+        except discord.HTTPException:
+            logger.exception("Failed to fetch message %s", message_id)
+            await interaction.followup.send("I couldn't read that message.",
+                                            ephemeral=True)
+            return
+
+        # Skip the edit if the message already shows this exact button
+        existing = self.reaction_roles.get(message_id)
+        if (existing is not None and existing.role_id == role.id
+                and existing.color == color.value
+                and emoji in (None, existing.emoji)
+                and any(child.custom_id == existing.custom_id
+                        for row in message.components
+                        for child in getattr(row, "children", ()))):
+            await interaction.followup.send(
+                "That message already has a button for this role.",
+                ephemeral=True)
+            return
 
         # Use a random emoji if none is provided
         if not emoji:
@@ -160,22 +332,29 @@ class ReactionRole(commands.Cog):
 
         custom_id = ''.join(
             random.choices(string.ascii_letters + string.digits, k=20))
-        await self.add_buttons_to_message(message, role.id, emoji, color,
-                                          custom_id)
-
-        # Save the reaction role info
-        guild_id = str(interaction.guild.id)
-        if guild_id not in self.reaction_roles:
-            self.reaction_roles[guild_id] = {}
-
-        self.reaction_roles[guild_id][str(message_id)] = {
-            "channel_id": str(channel_id),
-            "role_id": str(role.id),
-            "emoji": emoji,
-            "color": str(color.value),
-            "custom_id": custom_id
-        }
-        self.save_reaction_roles()
+        entry = ReactionRoleEntry(interaction.guild.id, channel_id, role.id,
+                                  emoji, color.value, custom_id)
+        view = self.build_view(entry)
+        try:
+            await message.edit(view=view)
+        except discord.HTTPException:
+            logger.exception("Failed to edit message %s", message_id)
+            await interaction.followup.send(
+                "I couldn't add a button to that message.", ephemeral=True)
+            return
+        # Clicks are routed through on_interaction, so the bot doesn't need
+        # to keep the view that message.edit registered
+        view.stop()
+
+        # Save the reaction role info, replacing any previous button
+        try:
+            await self.save_reaction_role(message_id, entry)
+        except sqlite3.Error:
+            logger.exception("Failed to save reaction role %s", message_id)
+            await interaction.followup.send(
+                "The button was added but couldn't be saved. Please try again.",
+                ephemeral=True)
+            return
 
         await interaction.followup.send("Reaction role added successfully!",
                                         ephemeral=True)
@@ -185,26 +364,32 @@ class ReactionRole(commands.Cog):
         description="Show a summary of all configured reaction roles")
     async def reaction_role_summary(self, interaction: discord.Interaction):
         """Command to show a summary of all configured reaction roles"""
-        guild_id = str(interaction.guild.id)
+        guild = interaction.guild
+        guild_id = guild.id
+        entries = [(message_id, entry)
+                   for message_id, entry in self.reaction_roles.items()
+                   if entry.guild_id == guild_id]
 
-        if guild_id not in self.reaction_roles or not self.reaction_roles[
-                guild_id]:
+        if not entries:
             await interaction.response.send_message(
                 "No reaction roles configured in this server.", ephemeral=True)
             return
 
         embed = discord.Embed(title="Reaction Roles Summary",
-                              color=discord.Color.blue())
-        for message_id, details in self.reaction_roles[guild_id].items():
-            channel = interaction.guild.get_channel(int(details['channel_id']))
-            message_url = f"https://discord.com/channels/{interaction.guild.id}/{channel.id}/{message_id}"
+                              color=SUMMARY_COLOR)
+        guild_url = f"https://discord.com/channels/{guild_id}"
+        for message_id, entry in entries:
+            channel = guild.get_channel(entry.channel_id)
+            if channel is None:
+                continue
+            message_url = f"{guild_url}/{channel.id}/{message_id}"
             embed.add_field(
                 name=f"Channel: {channel.name}",
                 value=
-                f"[Message](<{message_url}>)\nRole: <@&{details['role_id']}>\nEmoji: {details['emoji']}",
+                f"[Message](<{message_url}>)\nRole: <@&{entry.role_id}>\nEmoji: {entry.emoji}",
                 inline=False)
 
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
 async def setup(bot):
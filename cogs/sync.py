@@ -2,25 +2,12 @@ from typing import Literal, Optional
 import discord
 from discord.ext import commands
 from main import Bot
-import aiohttp
 
 
 class Sync(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession()
-
-    async def close(self):
-        await self.session.close()
-
-    @commands.Cog.listener()
-    async def on_shutdown(self):
-        await self.close()
-
-    @commands.Cog.listener()
-    async def on_disconnect(self):
-        await self.close()
 
     @commands.command()
     @commands.guild_only()
@@ -12,18 +12,7 @@ class Weather(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession()
-
-    async def close(self):
-        await self.session.close()
-
-    @commands.Cog.listener()
-    async def on_shutdown(self):
-        await self.close()
-
-    @commands.Cog.listener()
-    async def on_disconnect(self):
-        await self.close()
+        self.session: aiohttp.ClientSession = bot.session
 
     @app_commands.command(
         name="weather", description="Get the weather for a specified location")
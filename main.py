@@ -6,7 +6,6 @@ import asyncio
 from aiohttp import ClientSession
 from typing import Any
 from webserver import keep_alive
-import aiohttp
 
 # -------------------------
 # Logging Configuration
@@ -27,7 +26,8 @@ class Bot(commands.Bot):
         super().__init__(command_prefix=command_prefix,
                          intents=intents,
                          **kwargs)
-        self.session = aiohttp.ClientSession()
+        # Shared by all cogs; owned and closed by main()
+        self.session = session
 
     async def setup_hook(self) -> None:
         try:
@@ -61,10 +61,6 @@ class Bot(commands.Bot):
                        **kwargs: Any) -> None:
         logger.error('Unhandled exception in %s.', event_method, exc_info=True)
 
-    async def close(self) -> None:
-        await self.session.close()
-        await super().close()
-
 
 # -------------------------
 # Main Function and Execution